@@ -0,0 +1,5 @@
+import os
+
+
+# Runs the CUDA kernel on Numba's simulator unless told otherwise. Must be set before Numba is imported.
+os.environ.setdefault("NUMBA_ENABLE_CUDASIM", "1")
@@ -0,0 +1,75 @@
+from copy import deepcopy
+from io import StringIO
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+import numpy as np
+
+from wordle_solver import Game, Main
+
+
+def check(secret_word: str, guess: str) -> str:
+    """Result of `guess` as a string of `MatchStatus` values, like the ones entered by the user"""
+    main = Main(StringIO(f"{secret_word}\n{guess}"))
+    guess_result = main.new_game(secret_word).automatic_check(guess)
+    assert guess_result.word == guess
+    return "".join(str(match_status.value) for match_status in guess_result.result)
+
+
+@pytest.mark.parametrize(
+    "secret_word, guess, expected",
+    [
+        ("CRANE", "CRANE", "22222"),
+        ("CRANE", "BOOST", "00000"),
+        # Only the first E is in the wrong position, the answer has a single E
+        ("CRANE", "EVERY", "10010"),
+        # The E in the correct position takes the answer's only E
+        ("ABODE", "EERIE", "00002"),
+        ("ABBEY", "BABES", "11220"),
+        # Accents are ignored
+        ("AVIÃO", "ÁGUAS", "20020"),
+        ("AVIÃO", "OLHAR", "10020"),
+    ],
+)
+def test_automatic_check(secret_word: str, guess: str, expected: str):
+    assert check(secret_word, guess) == expected
+
+
+def play(main: Main, secret_word: str, state_cache: Optional[dict]) -> list[tuple]:
+    """Plays an automatic game, returning the history and filter results after each guess"""
+    game = Game(main.words, main.word_codes, main.word_char_count, main.word_char_occurrence, secret_word, state_cache)
+    states = []
+    while True:
+        guess_result = game.automatic_check(game.automatic_guess())
+        game.merge_result(guess_result)
+        states.append(
+            (game.history, game.possible_words.copy(), game.letter_pos_hist.copy(), game.letter_count_hist.copy())
+        )
+        if guess_result:
+            return states
+
+
+def test_state_cache():
+    words = (Path(__file__).parent.parent / "wordle.txt").read_text().split()[:1000]
+    main = Main(StringIO("\n".join(words)))
+    first_secret_word, *secret_words = main.words[::100]
+
+    play(main, first_secret_word, main.state_cache)
+    first_game_cache = deepcopy(main.state_cache)
+
+    # Every game opens with the same guess, so the next games reuse the states cached by the first one
+    for secret_word in secret_words:
+        cached_states = play(main, secret_word, main.state_cache)
+        uncached_states = play(main, secret_word, None)
+        assert len(cached_states) == len(uncached_states)
+        for cached, uncached in zip(cached_states, uncached_states):
+            assert cached[0] == uncached[0]
+            for cached_array, uncached_array in zip(cached[1:], uncached[1:]):
+                np.testing.assert_array_equal(cached_array, uncached_array)
+
+    # The arrays shared through the cache are never changed in place
+    for history, state in first_game_cache.items():
+        for first_game_array, array in zip(state, main.state_cache[history]):
+            np.testing.assert_array_equal(array, first_game_array)
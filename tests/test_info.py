@@ -0,0 +1,28 @@
+from wordle_solver import AllInfo, CharInfo, GuessResult, MatchStatus
+
+
+def guess_result(word: str, result: str) -> GuessResult:
+    return GuessResult(word, [MatchStatus(int(match_status)) for match_status in result])
+
+
+def test_add():
+    # The answer is ABODE
+    info = AllInfo() + guess_result("EERIE", "00002")
+    assert info.char_info["E"] == CharInfo("E", correct_mask=0b10000, wrong_mask=0b00011, min_amount=1, max_amount=1)
+    assert info.char_info["R"] == CharInfo("R", wrong_mask=0b00100, max_amount=0)
+    assert info.char_info["I"] == CharInfo("I", wrong_mask=0b01000, max_amount=0)
+    # Only 4 letters are unknown
+    assert info.char_info["A"] == CharInfo("A", max_amount=4)
+    assert info.char_info["Z"] == CharInfo("Z", max_amount=4)
+
+    next_info = info + guess_result("ABOUT", "22200")
+    assert next_info.char_info["A"] == CharInfo("A", correct_mask=0b00001, min_amount=1, max_amount=2)
+    assert next_info.char_info["B"] == CharInfo("B", correct_mask=0b00010, min_amount=1, max_amount=2)
+    assert next_info.char_info["O"] == CharInfo("O", correct_mask=0b00100, min_amount=1, max_amount=2)
+    assert next_info.char_info["U"] == CharInfo("U", wrong_mask=0b01000, max_amount=0)
+    assert next_info.char_info["T"] == CharInfo("T", wrong_mask=0b10000, max_amount=0)
+    # Not in the guess, but only 1 letter is still unknown
+    assert next_info.char_info["Z"] == CharInfo("Z", max_amount=1)
+    # Chars without new info are shared with the previous `AllInfo`
+    for char in "ERI":
+        assert next_info.char_info[char] is info.char_info[char]
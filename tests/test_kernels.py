@@ -0,0 +1,66 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+import numpy as np
+
+import wordle_solver
+from wordle_solver import Main
+
+
+numba = pytest.importorskip("numba")
+from numba import cuda  # noqa: E402
+
+
+VOCABULARY_DIR = Path(__file__).parent.parent
+NUM_WORDS = 1000
+NUM_GAMES = 4
+
+
+@pytest.fixture(scope="module", params=["wordle.txt", "termooo.txt"])
+def main(request) -> Main:
+    words = (VOCABULARY_DIR / request.param).read_text().split()[:NUM_WORDS]
+    return Main(StringIO("\n".join(words)))
+
+
+def game_states(main: Main):
+    """Plays a few games, yielding each game before a guess and the result of that guess"""
+    for secret_word in main.words[:: len(main.words) // NUM_GAMES]:
+        game = main.new_game(secret_word)
+        while True:
+            guess = game.automatic_guess()
+            result = game.automatic_check(guess)
+            yield game, result
+            game.merge_result(result)
+            if result:
+                break
+
+
+def test_filter_words(main: Main):
+    for game, result in game_states(main):
+        constraints = (game.all_info + result).constraints(game.word_size)
+        args = (game.possible_words, game.word_codes, game.word_char_count, *constraints)
+        expected = wordle_solver._filter_words_numpy(*args)
+        actual = wordle_solver._filter_words(*args)
+        for expected_array, actual_array in zip(expected, actual):
+            np.testing.assert_array_equal(actual_array, expected_array)
+
+
+def test_score_words(main: Main):
+    for game, _ in game_states(main):
+        args = (game.word_codes, game.word_char_occurrence, game.letter_pos_hist, *game.letter_count_sums())
+        np.testing.assert_array_equal(wordle_solver._score_words(*args), wordle_solver._score_words_numpy(*args))
+
+
+def test_score_words_cuda(main: Main):
+    if not cuda.is_available():
+        pytest.skip("CUDA is not available, set NUMBA_ENABLE_CUDASIM=1 to use the simulator")
+    gpu_words = (cuda.to_device(main.word_codes), cuda.to_device(main.word_char_occurrence))
+    for game, _ in game_states(main):
+        head_tail = game.letter_count_sums()
+        expected = wordle_solver._score_words_numpy(
+            game.word_codes, game.word_char_occurrence, game.letter_pos_hist, *head_tail
+        )
+        actual = wordle_solver._score_words_cuda(*gpu_words, game.letter_pos_hist, *head_tail)
+        np.testing.assert_array_equal(actual, expected)
@@ -1,20 +1,51 @@
 import argparse
-import re
 import unicodedata
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import Counter
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import lru_cache
+from itertools import groupby
 from math import inf
+from multiprocessing import get_context
+from operator import itemgetter
 from random import choice, sample
 from string import ascii_uppercase
 from sys import stderr
 from typing import Optional
 
+import numpy as np
 from termcolor import colored
 
 
+try:
+    import numba
+    from numba import cuda
+except ImportError:  # Numba is optional, the NumPy implementation is used without it
+    numba = None
+
+# Vocabularies at least this large are scored on the GPU, if one is available
+CUDA_MIN_WORDS = 50_000
+# The GPU kernel keeps the letter histograms in fixed-size shared arrays, so longer words are scored on the CPU
+MAX_WORD_SIZE = 32
+NUM_CHARS = len(ascii_uppercase)
+# Shapes of the GPU's shared tables, which must be constants when the kernel is compiled
+_GPU_POS_HIST_SHAPE = (NUM_CHARS, MAX_WORD_SIZE + 1)
+_GPU_COUNT_HIST_SHAPE = (NUM_CHARS, MAX_WORD_SIZE + 2)
+# Filter results are shared between games for histories of up to this many guesses.
+# Automatic games always open with the same guess, so their first few filters repeat a lot
+STATE_CACHE_MAX_GUESSES = 2
+
+
+# Combining diacritical marks, which NFD splits out of accented letters
+_STRIP_COMBINING = dict.fromkeys(range(0x0300, 0x0370))
+
+
+@lru_cache(maxsize=65536)  # Large enough to keep the whole vocabulary, which `Main` normalizes upfront
 def normalize(s: str) -> str:
-    return "".join(c for c in unicodedata.normalize("NFD", s.upper()) if unicodedata.category(c) != "Mn")
+    s = s.upper()
+    if s.isascii():
+        return s
+    return unicodedata.normalize("NFD", s).translate(_STRIP_COMBINING)
 
 
 class MatchStatus(Enum):
@@ -23,7 +54,14 @@ class MatchStatus(Enum):
     CORRECT_POSITION = 2
 
 
-@dataclass
+MATCH_STATUS_COLORS = {
+    MatchStatus.NO_MATCH: "red",
+    MatchStatus.WRONG_POSITION: "yellow",
+    MatchStatus.CORRECT_POSITION: "green",
+}
+
+
+@dataclass(slots=True)
 class GuessResult:
     word: str
     result: list[MatchStatus]
@@ -32,192 +70,401 @@ class GuessResult:
         return all([match_status == MatchStatus.CORRECT_POSITION for match_status in self.result])
 
     def __str__(self) -> str:
-        colors = {
-            MatchStatus.NO_MATCH: "red",
-            MatchStatus.WRONG_POSITION: "yellow",
-            MatchStatus.CORRECT_POSITION: "green",
-        }
-        return "".join([colored(char, colors[match_status]) for char, match_status in zip(self.word, self.result)])
+        # Colors each run of consecutive chars with the same status at once
+        return "".join(
+            colored("".join(char for char, _ in run), MATCH_STATUS_COLORS[match_status])
+            for match_status, run in groupby(zip(self.word, self.result), key=itemgetter(1))
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CharInfo:
     char: str
-    correct_positions: set[int] = field(default_factory=set)
-    wrong_positions: set[int] = field(default_factory=set)
+    # Bitmasks of positions: Bit `i` is set if the char is known to be (or not be) at position `i`
+    correct_mask: int = 0
+    wrong_mask: int = 0
     min_amount: int = 0
     max_amount: int = inf
 
-    def match(self, word):
-        for i in self.correct_positions:
-            if word[i] != self.char:
-                return False
-        for i in self.wrong_positions:
-            if word[i] == self.char:
-                return False
-        count = word.count(self.char)
-        if count < self.min_amount or count > self.max_amount:
-            return False
-        return True
-
-    def add(
-        self, match_count: int, has_mismatches: bool, correct_positions: set[int], wrong_positions: set[int]
-    ) -> "CharInfo":
-        correct_positions = (
-            self.correct_positions if correct_positions is None else self.correct_positions | correct_positions
-        )
-        wrong_positions = self.wrong_positions if wrong_positions is None else self.wrong_positions | wrong_positions
+    def add(self, match_count: int, has_mismatches: bool, correct_mask: int, wrong_mask: int) -> "CharInfo":
+        correct_mask |= self.correct_mask
         return CharInfo(
             char=self.char,
-            correct_positions=correct_positions,
-            wrong_positions=wrong_positions,
-            min_amount=max(self.min_amount, match_count, len(correct_positions)),
+            correct_mask=correct_mask,
+            wrong_mask=self.wrong_mask | wrong_mask,
+            min_amount=max(self.min_amount, match_count, correct_mask.bit_count()),
             max_amount=match_count if has_mismatches else self.max_amount,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AllInfo:
     char_info: dict[str, CharInfo] = field(default_factory=lambda: {char: CharInfo(char) for char in ascii_uppercase})
 
-    def match(self, word) -> bool:
-        word = normalize(word)
-        for char in self.char_info.values():
-            if not char.match(word):
-                return False
-        return True
-
-    def filter(self, words: set[str]) -> set[str]:
-        return set(filter(self.match, words))
+    def constraints(self, word_size: int) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the known info as arrays:
+        - min_count[c], max_count[c]: Range of occurrences of the c-th letter of `ascii_uppercase`
+        - required_code[i]: Letter code known to be at position `i`, or -1
+        - forbidden_codes[i]: Bitmask of letter codes known not to be at position `i`
+        """
+        min_count = np.zeros(len(self.char_info), dtype=np.int64)
+        max_count = np.zeros(len(self.char_info), dtype=np.int64)
+        required_code = np.full(word_size, -1, dtype=np.int64)
+        forbidden_codes = np.zeros(word_size, dtype=np.int64)
+        for char_code, info in enumerate(self.char_info.values()):
+            min_count[char_code] = info.min_amount
+            max_count[char_code] = min(info.max_amount, word_size)
+            for i in range(word_size):
+                if info.correct_mask >> i & 1:
+                    required_code[i] = char_code
+                if info.wrong_mask >> i & 1:
+                    forbidden_codes[i] |= 1 << char_code
+        return min_count, max_count, required_code, forbidden_codes
+
+    def filter(
+        self, word_mask: np.ndarray, word_codes: np.ndarray, word_char_count: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns a copy of the boolean `word_mask` keeping only the words matching this info,
+        along with the letter histograms of the matching words:
+        - letter_pos_hist[c, i]: Number of words with the c-th letter of `ascii_uppercase` at position `i`
+        - letter_count_hist[c, n]: Number of words with exactly `n` occurrences of the c-th letter
+        """
+        return _filter_words(word_mask, word_codes, word_char_count, *self.constraints(word_codes.shape[1]))
 
     def __add__(self, guess_result: GuessResult) -> "AllInfo":
         word_size = len(guess_result.word)
-        char_match_count = defaultdict(int)
+        char_match_count: dict[str, int] = {}
         char_mismatches: set[str] = set()
-        char_correct_positions = defaultdict(set)
-        char_wrong_positions = defaultdict(set)
+        char_correct_mask: dict[str, int] = {}
+        char_wrong_mask: dict[str, int] = {}
 
         for i, (char, result) in enumerate(zip(normalize(guess_result.word), guess_result.result)):
             if result == MatchStatus.NO_MATCH:
                 char_mismatches.add(char)
-                char_wrong_positions[char].add(i)
+                char_wrong_mask[char] = char_wrong_mask.get(char, 0) | 1 << i
             else:
-                char_match_count[char] += 1
+                char_match_count[char] = char_match_count.get(char, 0) + 1
                 if result == MatchStatus.CORRECT_POSITION:
-                    char_correct_positions[char].add(i)
+                    char_correct_mask[char] = char_correct_mask.get(char, 0) | 1 << i
                 else:
-                    char_wrong_positions[char].add(i)
-
-        ret = AllInfo(
-            char_info={
-                char: info.add(
-                    char_match_count.get(char, 0),
-                    char in char_mismatches,
-                    char_correct_positions.get(char),
-                    char_wrong_positions.get(char),
-                )
-                for char, info in self.char_info.items()
-            }
-        )
-        known_char_count = sum(info.min_amount for info in ret.char_info.values())
-        unknown_char_count = word_size - known_char_count
-        for char_info in ret.char_info.values():
-            char_info.max_amount = min(
-                char_info.max_amount,
-                char_info.min_amount + unknown_char_count,
-                word_size - len(char_info.wrong_positions),
+                    char_wrong_mask[char] = char_wrong_mask.get(char, 0) | 1 << i
+
+        # Only the chars in the guess get new info, the others are shared with `self`
+        char_info = dict(self.char_info)
+        for char in char_correct_mask.keys() | char_wrong_mask.keys():
+            char_info[char] = char_info[char].add(
+                char_match_count.get(char, 0),
+                char in char_mismatches,
+                char_correct_mask.get(char, 0),
+                char_wrong_mask.get(char, 0),
             )
 
-        return ret
+        known_char_count = sum(info.min_amount for info in char_info.values())
+        unknown_char_count = word_size - known_char_count
+        for char, info in char_info.items():
+            max_amount = min(
+                info.max_amount,
+                info.min_amount + unknown_char_count,
+                word_size - info.wrong_mask.bit_count(),
+            )
+            if max_amount != info.max_amount:
+                char_info[char] = replace(info, max_amount=max_amount)
+
+        return AllInfo(char_info)
+
+
+def _filter_words_numpy(word_mask, word_codes, word_char_count, min_count, max_count, required_code, forbidden_codes):
+    word_ids = np.flatnonzero(word_mask)
+    codes = word_codes[word_ids]
+    char_count = word_char_count[word_ids]
+    mask = np.all((char_count >= min_count) & (char_count <= max_count), axis=1)
+    mask &= np.all((required_code < 0) | (codes == required_code), axis=1)
+    mask &= ~np.any((forbidden_codes >> codes) & 1, axis=1)
+    ret = np.zeros_like(word_mask)
+    ret[word_ids[mask]] = True
+
+    # Both histograms have shape (num_chars, word_size + 1): Count flattened (char, column) indices with bincount
+    num_chars, num_cols = len(min_count), word_codes.shape[1] + 1
+    pos_index = codes[mask].astype(np.intp) * num_cols + np.arange(num_cols - 1)
+    letter_pos_hist = np.bincount(pos_index.ravel(), minlength=num_chars * num_cols).astype(np.int32)
+    letter_pos_hist = letter_pos_hist.reshape(num_chars, num_cols)
+    count_index = np.arange(num_chars) * num_cols + char_count[mask]
+    letter_count_hist = np.bincount(count_index.ravel(), minlength=num_chars * num_cols).astype(np.int32)
+    letter_count_hist = letter_count_hist.reshape(num_chars, num_cols)
+    return ret, letter_pos_hist, letter_count_hist
+
+
+def _score_words_numpy(word_codes, word_char_occurrence, letter_pos_hist, letter_count_head, letter_count_tail):
+    positions = np.arange(word_codes.shape[1])
+    p_correct = letter_pos_hist[word_codes, positions]
+    p_pos = np.maximum(letter_count_tail[word_codes, word_char_occurrence] - p_correct, 0)
+    p_wrong = letter_count_head[word_codes, word_char_occurrence]
+
+    # p_correct * p_correct + p_pos * p_pos + p_wrong * p_wrong
+    # The product is taken in floating point, since it easily overflows int64
+    return np.prod(np.maximum.reduce([p_correct, p_pos, p_wrong]), axis=1, dtype=np.float64)
+
+
+if numba is None:
+    _filter_words = _filter_words_numpy
+    _score_words = _score_words_numpy
+else:
+    # Not parallel: The histograms of the matching words are accumulated in the same pass
+    @numba.njit(cache=True)
+    def _filter_words(word_mask, word_codes, word_char_count, min_count, max_count, required_code, forbidden_codes):
+        num_words, word_size = word_codes.shape
+        ret = word_mask.copy()
+        letter_pos_hist = np.zeros((len(min_count), word_size + 1), dtype=np.int32)
+        letter_count_hist = np.zeros((len(min_count), word_size + 1), dtype=np.int32)
+        for word_id in range(num_words):
+            if not word_mask[word_id]:
+                continue
+            matches = True
+            for char_code in range(len(min_count)):
+                count = word_char_count[word_id, char_code]
+                if count < min_count[char_code] or count > max_count[char_code]:
+                    matches = False
+                    break
+            if matches:
+                for i in range(word_size):
+                    code = word_codes[word_id, i]
+                    if (required_code[i] >= 0 and code != required_code[i]) or (forbidden_codes[i] >> code) & 1:
+                        matches = False
+                        break
+            if not matches:
+                ret[word_id] = False
+                continue
+            for i in range(word_size):
+                letter_pos_hist[word_codes[word_id, i], i] += 1
+            for char_code in range(len(min_count)):
+                letter_count_hist[char_code, word_char_count[word_id, char_code]] += 1
+        return ret, letter_pos_hist, letter_count_hist
+
+    @numba.njit(parallel=True, cache=True)
+    def _score_words(word_codes, word_char_occurrence, letter_pos_hist, letter_count_head, letter_count_tail):
+        num_words, word_size = word_codes.shape
+        scores = np.empty(num_words)
+        for w in numba.prange(num_words):
+            score = 1.0
+            for i in range(word_size):
+                char = word_codes[w, i]
+                count = word_char_occurrence[w, i]
+                p_correct = letter_pos_hist[char, i]
+                p_pos = max(letter_count_tail[char, count] - p_correct, 0)
+                p_wrong = letter_count_head[char, count]
+                score *= max(p_correct, max(p_pos, p_wrong))
+            scores[w] = score
+        return scores
+
+    @cuda.jit
+    def _score_words_cuda_kernel(
+        word_codes, word_char_occurrence, letter_pos_hist, letter_count_head, letter_count_tail, scores
+    ):
+        # The histograms are tiny and read by every thread: Keep a copy in shared memory
+        shared_pos_hist = cuda.shared.array(_GPU_POS_HIST_SHAPE, dtype=numba.int32)
+        shared_count_head = cuda.shared.array(_GPU_COUNT_HIST_SHAPE, dtype=numba.int32)
+        shared_count_tail = cuda.shared.array(_GPU_COUNT_HIST_SHAPE, dtype=numba.int32)
+        num_cols = letter_count_head.shape[1]
+        for k in range(cuda.threadIdx.x, NUM_CHARS * num_cols, cuda.blockDim.x):
+            char, col = k // num_cols, k % num_cols
+            if col < letter_pos_hist.shape[1]:
+                shared_pos_hist[char, col] = letter_pos_hist[char, col]
+            shared_count_head[char, col] = letter_count_head[char, col]
+            shared_count_tail[char, col] = letter_count_tail[char, col]
+        cuda.syncthreads()
+
+        w = cuda.grid(1)
+        if w >= word_codes.shape[0]:
+            return
+        score = 1.0
+        for i in range(word_codes.shape[1]):
+            char = word_codes[w, i]
+            count = word_char_occurrence[w, i]
+            p_correct = shared_pos_hist[char, i]
+            p_pos = max(shared_count_tail[char, count] - p_correct, 0)
+            p_wrong = shared_count_head[char, count]
+            score *= max(p_correct, max(p_pos, p_wrong))
+        scores[w] = score
+
+    def _score_words_cuda(word_codes, word_char_occurrence, letter_pos_hist, letter_count_head, letter_count_tail):
+        """Same as `_score_words`, but `word_codes` and `word_char_occurrence` are arrays on the GPU"""
+        threads_per_block = 256
+        num_blocks = (word_codes.shape[0] + threads_per_block - 1) // threads_per_block
+        scores = cuda.device_array(word_codes.shape[0], dtype=np.float64)
+        _score_words_cuda_kernel[num_blocks, threads_per_block](
+            word_codes,
+            word_char_occurrence,
+            cuda.to_device(letter_pos_hist),
+            cuda.to_device(letter_count_head),
+            cuda.to_device(letter_count_tail),
+            scores,
+        )
+        return scores.copy_to_host()
 
 
 class Game:
-    def __init__(self, words: set[str], secret_word: Optional[str] = None):
+    def __init__(
+        self,
+        words: list[str],
+        word_codes: np.ndarray,
+        word_char_count: np.ndarray,
+        word_char_occurrence: np.ndarray,
+        secret_word: Optional[str] = None,
+        state_cache: Optional[dict] = None,
+        gpu_words: Optional[tuple] = None,
+    ):
         self.secret_word = secret_word
-        self.all_info = AllInfo()
-        self.word_size = len(next(iter(words)))
+        self.secret_word_normalized = None if secret_word is None else normalize(secret_word)
+        self.word_size = word_codes.shape[1]
         self.words = words
-        self.possible_words = words
+        self.word_codes = word_codes
+        self.word_char_count = word_char_count
+        self.word_char_occurrence = word_char_occurrence
+        # Filter results of previous games, indexed by the sequence of (guess, result) that led to them
+        self.state_cache = state_cache
+        self.history: tuple[tuple[str, tuple[MatchStatus, ...]], ...] = ()
+        # possible_words[w]: Whether the w-th word is still a possible answer
+        self.possible_words = np.ones(len(words), dtype=bool)
+        self.set_info(AllInfo())
+        # (word_codes, word_char_occurrence) already uploaded to the GPU, if scoring should happen there
+        self.gpu_words = gpu_words
 
     def merge_result(self, guess_result: GuessResult):
-        self.all_info += guess_result
-        self.possible_words = self.all_info.filter(self.possible_words)
+        self.history += ((guess_result.word, tuple(guess_result.result)),)
+        self.set_info(self.all_info + guess_result)
+
+    def set_info(self, all_info: AllInfo):
+        cacheable = self.state_cache is not None and len(self.history) <= STATE_CACHE_MAX_GUESSES
+        state = self.state_cache.get(self.history) if cacheable else None
+        if state is None:
+            state = all_info.filter(self.possible_words, self.word_codes, self.word_char_count)
+            if cacheable:
+                self.state_cache[self.history] = state
+        self.all_info = all_info
+        self.possible_words, self.letter_pos_hist, self.letter_count_hist = state
+
+    @property
+    def num_possible_words(self) -> int:
+        return np.count_nonzero(self.possible_words)
+
+    def letter_count_sums(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Cumulative sums of `letter_count_hist`:
+        letter_count_head[char, n] = sum(letter_count_hist[char, :n])
+        letter_count_tail[char, n] = sum(letter_count_hist[char, n:])
+        """
+        letter_count_head = np.zeros((len(ascii_uppercase), self.word_size + 2), dtype=np.int32)
+        np.cumsum(self.letter_count_hist, axis=1, out=letter_count_head[:, 1:])
+        letter_count_tail = np.int32(self.num_possible_words) - letter_count_head
+        return letter_count_head, letter_count_tail
 
     def automatic_guess(self) -> str:
-        if len(self.possible_words) == 1:
-            return next(iter(self.possible_words))  # Knows the answer
-        elif len(self.possible_words) == 0:
+        num_possible_words = self.num_possible_words
+        if num_possible_words == 1:
+            return self.words[np.argmax(self.possible_words)]  # Knows the answer
+        elif num_possible_words == 0:
             return None  # Give up, doesn't know the word
 
-        # Look into the vocabulary for the word that is likely to reduces the possible_words the most
-        letter_pos_prob = {char: [0] * (self.word_size + 1) for char in ascii_uppercase}
-        letter_count_prob = {char: [0] * (self.word_size + 1) for char in ascii_uppercase}
-        for word in self.possible_words:
-            word_normalized = normalize(word)
-            for i, char in enumerate(word_normalized):
-                letter_pos_prob[char][i] += 1
-            for char in ascii_uppercase:
-                letter_count_prob[char][word_normalized.count(char)] += 1
-
-        for char in ascii_uppercase:
-            for i in range(self.word_size + 1):
-                letter_pos_prob[char][i] /= len(self.words)
-                letter_count_prob[char][i] /= len(self.words)
-
-        best_guess = None
-        best_score = inf
-        for word in self.words:
-            score = 1
-            char_count = defaultdict(int)
-            for i, char in enumerate(normalize(word)):
-                char_count[char] += 1
-                count = char_count[char]
-
-                p_correct = letter_pos_prob[char][i]
-                p_pos = max(sum(letter_count_prob[char][count:]) - p_correct, 0)
-                p_wrong = sum(letter_count_prob[char][:count])
-
-                score *= max(p_correct, p_pos, p_wrong)  # p_correct * p_correct + p_pos * p_pos + p_wrong * p_wrong
-            if score < best_score:
-                best_score = score
-                best_guess = word
-        return best_guess
+        # Look into the vocabulary for the word that is likely to reduces the possible_words the most.
+        # Scores are computed from word counts rather than probabilities: Only their order matters.
+        letter_count_head, letter_count_tail = self.letter_count_sums()
+        if self.gpu_words is not None:
+            scores = _score_words_cuda(*self.gpu_words, self.letter_pos_hist, letter_count_head, letter_count_tail)
+        else:
+            scores = _score_words(
+                self.word_codes, self.word_char_occurrence, self.letter_pos_hist, letter_count_head, letter_count_tail
+            )
+        return self.words[np.argmin(scores)]
 
     def automatic_check(self, guess: str) -> GuessResult:
-        answer_normalized = normalize(self.secret_word)
+        answer_normalized = self.secret_word_normalized
         guess_normalized = normalize(guess)
 
-        actual_letters = list(answer_normalized)
-        size = len(actual_letters)
-        result = [None] * size
+        size = len(answer_normalized)
+        result = [MatchStatus.NO_MATCH] * size
+        remaining_letters = Counter()
 
         # Search for exact match
         for i in range(size):
-            if guess_normalized[i] == actual_letters[i]:
+            if guess_normalized[i] == answer_normalized[i]:
                 result[i] = MatchStatus.CORRECT_POSITION
-                actual_letters[i] = None
+            else:
+                remaining_letters[answer_normalized[i]] += 1
 
         # Search for wrong position match
         for i in range(size):
-            if result[i] is None:
-                for j in range(size):
-                    if guess_normalized[i] == actual_letters[j]:
-                        result[i] = MatchStatus.WRONG_POSITION
-                        actual_letters[j] = None
-                        break
-                if result[i] is None:
-                    result[i] = MatchStatus.NO_MATCH
+            char = guess_normalized[i]
+            if result[i] is MatchStatus.NO_MATCH and remaining_letters[char] > 0:
+                result[i] = MatchStatus.WRONG_POSITION
+                remaining_letters[char] -= 1
 
         return GuessResult(guess, result)
 
 
+# `Main` instance used by the benchmark's worker processes, inherited from the parent process when forked
+_worker_main: Optional["Main"] = None
+
+
+def _init_worker(main: "Main"):
+    global _worker_main
+    _worker_main = main
+    # CUDA can't be used after forking, so the workers score on the CPU even if the parent process uses the GPU
+    main.gpu_words = None
+    if numba is not None:
+        numba.set_num_threads(1)  # Parallelism comes from the worker processes
+
+
+def _play_one_game(word_id: int) -> Optional[int]:
+    return _worker_main.automatic_game(_worker_main.words[word_id])
+
+
 class Main:
     def __init__(self, words_file: argparse.FileType) -> None:
         with words_file:
-            words = sorted(re.findall(r"\w+", words_file.read().upper()))
+            words = sorted(words_file.read().upper().split())
 
         self.normalized_words = {normalize(word): word for word in words}
         self.words = list(self.normalized_words.values())
+        self.words_normalized = list(self.normalized_words.keys())
+
+        # word_codes[w, i]: Index in `ascii_uppercase` of the i-th letter of the w-th word.
+        # Stored column-major, since letters are usually compared one position at a time across many words
+        word_bytes = np.frombuffer("".join(self.words_normalized).encode("ascii"), dtype=np.uint8)
+        self.word_codes = np.asfortranarray(word_bytes.reshape(len(self.words), -1) - ord("A"))
+
+        # word_char_count[w, c]: Number of occurrences of the c-th letter of `ascii_uppercase` in the w-th word
+        self.word_char_count = np.zeros((len(self.words), len(ascii_uppercase)), dtype=np.uint8)
+        np.add.at(self.word_char_count, (np.arange(len(self.words))[:, None], self.word_codes), 1)
+
+        # word_char_occurrence[w, i]: Number of occurrences of the i-th letter of the w-th word up to position `i`
+        self.word_char_occurrence = np.asfortranarray(
+            np.triu(self.word_codes[:, :, None] == self.word_codes[:, None, :]).sum(axis=1, dtype=np.uint8)
+        )
+
+        # Large vocabularies are scored on the GPU, with the words uploaded once
+        self.gpu_words = None
+        if (
+            numba is not None
+            and len(self.words) >= CUDA_MIN_WORDS
+            and self.word_codes.shape[1] <= MAX_WORD_SIZE
+            and cuda.is_available()
+        ):
+            self.gpu_words = (cuda.to_device(self.word_codes), cuda.to_device(self.word_char_occurrence))
+
+        self.state_cache = {}
+
+    def new_game(self, secret_word: Optional[str] = None) -> Game:
+        return Game(
+            self.words,
+            self.word_codes,
+            self.word_char_count,
+            self.word_char_occurrence,
+            secret_word,
+            self.state_cache,
+            self.gpu_words,
+        )
 
     def shuffled_words(self):
         while True:
@@ -247,6 +494,39 @@ class Main:
 
             print("Invalid result", file=stderr)
 
+    def automatic_game(self, secret_word: str) -> Optional[int]:
+        """Plays a game without user interaction, returning the number of guesses or None if it gave up"""
+        game = self.new_game(secret_word)
+        num_guesses = 0
+        while True:
+            guess = game.automatic_guess()
+            if guess is None:
+                return None
+            num_guesses += 1
+            guess_result = game.automatic_check(guess)
+            game.merge_result(guess_result)
+            if guess_result:
+                return num_guesses
+
+    def benchmark(self, processes: int = 1):
+        """Plays a game for every word in the vocabulary and shows how many guesses were needed"""
+        if processes > 1:
+            # Forked workers share the vocabulary with this process instead of receiving a pickled copy
+            with get_context("fork").Pool(processes, initializer=_init_worker, initargs=(self,)) as pool:
+                results = pool.map(_play_one_game, range(len(self.words)), chunksize=16)
+        else:
+            results = [self.automatic_game(word) for word in self.words]
+
+        results_count = Counter(results)
+        gave_up = results_count.pop(None, 0)
+        for num_guesses, count in sorted(results_count.items()):
+            print(f"{num_guesses} guesses: {count} words")
+        if gave_up:
+            print(colored(f"Gave up: {gave_up} words", "red"))
+        solved = len(results) - gave_up
+        if solved:
+            print(f"Average: {sum(n * count for n, count in results_count.items()) / solved:.3f} guesses")
+
     def game_loop(self, user_guess, user_check, hints=0):
         if user_check:
             print(
@@ -261,15 +541,19 @@ class Main:
             if user_check:
                 secret_word = "<?>"
             print(f"Game #{game_num + 1}: {secret_word}")
-            game = Game(self.words, secret_word)
+            game = self.new_game(secret_word)
 
             num_guesses = 0
             while True:
                 if hints:
                     max_hints = 10
-                    samples = sorted(sample(list(game.possible_words), min(max_hints, len(game.possible_words))))
-                    hint_str = (", ".join(samples)) + (", ..." if len(game.possible_words) > max_hints else "")
-                    print(f"Hint: {len(game.possible_words)} possible words: {hint_str}")
+                    possible_ids = np.flatnonzero(game.possible_words)
+                    num_possible_words = len(possible_ids)
+                    # Sampling from a range only picks `max_hints` indices, instead of copying every possible word
+                    sample_ids = possible_ids[sample(range(num_possible_words), min(max_hints, num_possible_words))]
+                    samples = sorted(self.words[word_id] for word_id in sample_ids)
+                    hint_str = (", ".join(samples)) + (", ..." if num_possible_words > max_hints else "")
+                    print(f"Hint: {num_possible_words} possible words: {hint_str}")
 
                 if user_guess:
                     guess = self.user_guess()
@@ -311,6 +595,22 @@ def cli_main():
     parser.add_argument("--guess", action="store_true", help="Guessing is performed by the iteractive user")
     parser.add_argument("--check", action="store_true", help="Check is performed by iteractive user")
     parser.add_argument("--hints", action="store_true", help="Shows hints of possible words")
+    parser.add_argument(
+        "--benchmark", action="store_true", help="Automatically solves every word and shows the number of guesses"
+    )
+    parser.add_argument(
+        "--parallel", metavar="N", type=int, help="Number of processes used to run the benchmark (default: 1)"
+    )
 
     args = parser.parse_args()
-    Main(args.words).game_loop(args.guess, args.check, args.hints)
+    if args.parallel is not None:
+        if not args.benchmark:
+            parser.error("--parallel can only be used with --benchmark")
+        if args.parallel <= 0:
+            parser.error("--parallel must be a positive number of processes")
+
+    main = Main(args.words)
+    if args.benchmark:
+        main.benchmark(args.parallel or 1)
+    else:
+        main.game_loop(args.guess, args.check, args.hints)